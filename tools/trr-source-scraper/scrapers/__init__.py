@@ -6,6 +6,11 @@ from scrapers.mitre_attack import MitreAttackScraper, fetch_mitre_technique
 from scrapers.duckduckgo import DuckDuckGoScraper, search_technique_sources
 from scrapers.site_fetcher import SiteFetcher, enrich_search_results, validate_search_result_links
 from scrapers.atomic_red_team import fetch_atomic_tests
+from scrapers.trr_scanner import (
+    GitHubTRRScanner,
+    ExistingTRRScanner,
+    scan_for_existing_trrs,
+)
 
 __all__ = [
     'MitreAttackScraper',
@@ -16,4 +21,7 @@ __all__ = [
     'enrich_search_results',
     'validate_search_result_links',
     'fetch_atomic_tests',
+    'GitHubTRRScanner',
+    'ExistingTRRScanner',
+    'scan_for_existing_trrs',
 ]
\ No newline at end of file
@@ -5,6 +5,7 @@ Optional dependency — the scraper works without Playwright installed.
 Only used for domains listed in config's js_rendered_domains.
 """
 
+import queue
 from typing import Optional
 
 try:
@@ -15,11 +16,23 @@ except ImportError:
 
 
 class PlaywrightFetcher:
-    """Manages a single headless browser instance for JS page rendering."""
+    """
+    Manages a single headless browser instance for JS page rendering.
+
+    Pages are pooled and reused across fetches — creating a page spawns
+    a renderer process, which dominates per-URL overhead when rendering
+    a batch. A fetched page navigates to about:blank before returning to
+    the pool so it holds no site state or DOM between URLs.
+    """
+
+    POOL_SIZE = 4
 
     def __init__(self, timeout_ms: int = 15000):
         self._browser = None
         self._playwright = None
+        self._context = None
+        self._pages: queue.Queue = queue.Queue()
+        self._page_count = 0
         self.timeout_ms = timeout_ms
 
     def _ensure_browser(self):
@@ -28,6 +41,30 @@ class PlaywrightFetcher:
         if self._browser is None:
             self._playwright = sync_playwright().start()
             self._browser = self._playwright.chromium.launch(headless=True)
+            self._context = self._browser.new_context()
+
+    def _acquire_page(self):
+        """Pop a pooled page, creating one if under the pool limit."""
+        try:
+            return self._pages.get_nowait()
+        except queue.Empty:
+            pass
+        if self._page_count < self.POOL_SIZE:
+            self._page_count += 1
+            return self._context.new_page()
+        return self._pages.get()
+
+    def _release_page(self, page):
+        """Blank a page and return it to the pool; drop it if unusable."""
+        try:
+            page.goto('about:blank')
+            self._pages.put(page)
+        except Exception:
+            self._page_count -= 1
+            try:
+                page.close()
+            except Exception:
+                pass
 
     def fetch_page_html(self, url: str) -> Optional[str]:
         """
@@ -37,20 +74,29 @@ class PlaywrightFetcher:
         page = None
         try:
             self._ensure_browser()
-            page = self._browser.new_page()
+            page = self._acquire_page()
             page.goto(url, timeout=self.timeout_ms, wait_until="networkidle")
             return page.content()
         except Exception:
             return None
         finally:
             if page:
-                try:
-                    page.close()
-                except Exception:
-                    pass
+                self._release_page(page)
 
     def close(self):
-        """Shut down the browser."""
+        """Shut down the pooled pages, context, and browser."""
+        while True:
+            try:
+                self._pages.get_nowait().close()
+            except queue.Empty:
+                break
+            except Exception:
+                pass
+        if self._context:
+            try:
+                self._context.close()
+            except Exception:
+                pass
         if self._browser:
             try:
                 self._browser.close()
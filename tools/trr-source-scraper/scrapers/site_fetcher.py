@@ -2,23 +2,117 @@
 Site metadata fetcher for extracting details from URLs.
 """
 
+import asyncio
+import os
 import re as _re
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Optional, List
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
 import requests
 
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import httpx
+    _FETCH_ERRORS = (requests.RequestException, httpx.HTTPError)
+except ImportError:
+    _FETCH_ERRORS = (requests.RequestException,)
+
 from utils import (
     RateLimiter,
+    AsyncRateLimiter,
     clean_text,
+    create_http2_client,
     create_session,
     extract_domain,
     is_valid_url,
-    extract_meta_description,
-    extract_title,
-    extract_date,
+    extract_page_metadata,
 )
 from utils.content_analysis import analyze_page_content, analyze_raw_text
 
+# Tags whose subtrees never contribute to content analysis. Straining
+# them out at parse time skips their DOM allocation entirely (scripts
+# and styles are often most of a page's bytes) while keeping body and
+# container divs intact for the analyzer's main-content detection.
+_ANALYSIS_SKIP_TAGS = frozenset((
+    'script', 'style', 'noscript', 'svg', 'iframe', 'form', 'link',
+    'img', 'picture', 'source', 'video', 'audio', 'canvas', 'template',
+))
+_ANALYSIS_STRAINER = SoupStrainer(
+    lambda name, attrs=None: name not in _ANALYSIS_SKIP_TAGS
+)
+
+# Compiled once — matched against every GitHub search result.
+_GITHUB_BLOB_RE = _re.compile(
+    r'https?://github\.com/([^/]+/[^/]+)/blob/(.+)', _re.IGNORECASE
+)
+
+# Bodies are never read past _BODY_CAP, and pages declaring more than
+# that via Content-Length only get a prefix read — metadata sits near
+# the top and the analyzer caps its text sample anyway, so a 20 MB page
+# costs O(cap) instead of O(page size).
+_BODY_CAP = 2_000_000
+_OVERSIZE_PREFIX = 512_000
+
+
+# Lazy singleton — parsing and analysis for the async batch paths run
+# here. lxml holds the GIL for most of a parse, so a thread executor
+# serializes parsing behind the event loop on multi-core machines; a
+# process pool parses on all cores while the loop keeps issuing I/O.
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        with _parse_pool_lock:
+            if _parse_pool is None:
+                _parse_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count()
+                )
+    return _parse_pool
+
+
+def _process_static_job(result: Dict, content_type: str, content: bytes) -> Dict:
+    """Picklable wrapper: run _process_static and return the result dict."""
+    _process_static(result, content_type, content)
+    return result
+
+
+def _process_github_raw_job(result: Dict, raw_text: str) -> Dict:
+    """Picklable wrapper: run _process_github_raw and return the result dict."""
+    _process_github_raw(result, raw_text)
+    return result
+
+
+def _read_body_capped(response) -> bytes:
+    """Read a streamed requests body, bounded by the size caps above."""
+    try:
+        declared = int(response.headers.get('Content-Length') or 0)
+    except ValueError:
+        declared = 0
+    if declared > _BODY_CAP:
+        data = response.raw.read(_OVERSIZE_PREFIX, decode_content=True)
+        response.close()
+        return data
+    chunks = []
+    read = 0
+    for chunk in response.iter_content(64 * 1024):
+        chunks.append(chunk)
+        read += len(chunk)
+        if read >= _BODY_CAP:
+            response.close()
+            break
+    return b''.join(chunks)
+
 
 class SiteFetcher:
     """
@@ -26,19 +120,67 @@ class SiteFetcher:
     """
     
     def __init__(self, rate_limiter: Optional[RateLimiter] = None, user_agent: str = ""):
+        # The limiter keeps one clock per domain, so fetches against
+        # different domains don't serialize on each other's politeness.
         self.rate_limiter = rate_limiter or RateLimiter(delay=2.0)
         self.session = create_session(user_agent or "TRR-Source-Scraper/1.0")
-    
+        # With httpx[http2] installed, small non-streamed requests
+        # (validation probes, GitHub raw files) multiplex over one
+        # HTTP/2 connection per host; streamed capped reads stay on the
+        # pooled requests session.
+        self._client = create_http2_client(
+            user_agent or "TRR-Source-Scraper/1.0"
+        )
+        # Validation results, keyed by full URL so the same URL isn't
+        # re-probed across link validation and later fetches. The query
+        # string matters: query-routed URLs (youtube.com/watch?v=...)
+        # are distinct pages that must not share one verdict.
+        self._validated: Dict[str, bool] = {}
+
     def validate_url(self, url: str) -> bool:
-        """Check if a URL is reachable via HEAD request."""
+        """
+        Check if a URL is reachable.
+
+        Probes with a one-byte ranged GET rather than HEAD — HEAD
+        responses are frequently not kept alive, so the ranged GET keeps
+        the pooled connection warm for the enrichment fetch that usually
+        follows. Hosts that reject ranged requests (416) fall back to
+        HEAD. Results are cached in-process.
+        """
         if not is_valid_url(url):
             return False
-        self.rate_limiter.wait()
+        cached = self._validated.get(url)
+        if cached is not None:
+            return cached
+        self.rate_limiter.wait(extract_domain(url))
         try:
-            response = self.session.head(url, timeout=10, allow_redirects=True)
-            return response.status_code < 400
-        except requests.RequestException:
-            return False
+            if self._client is not None:
+                response = self._client.get(
+                    url, headers={'Range': 'bytes=0-0'}
+                )
+                status = response.status_code
+                if status == 416:
+                    status = self._client.head(url).status_code
+            else:
+                response = self.session.get(
+                    url,
+                    headers={'Range': 'bytes=0-0'},
+                    stream=True,
+                    timeout=10,
+                    allow_redirects=True,
+                )
+                status = response.status_code
+                response.close()
+                if status == 416:
+                    response = self.session.head(
+                        url, timeout=10, allow_redirects=True
+                    )
+                    status = response.status_code
+            ok = status < 400
+        except _FETCH_ERRORS:
+            ok = False
+        self._validated[url] = ok
+        return ok
 
     def fetch_page_metadata(self, url: str) -> Optional[Dict]:
         """
@@ -53,92 +195,217 @@ class SiteFetcher:
         if not is_valid_url(url):
             return None
 
-        self.rate_limiter.wait()
+        self.rate_limiter.wait(extract_domain(url))
 
+        # stream=True defers the body read until after the Content-Type
+        # peek, so non-HTML responses (PDFs, images) close the connection
+        # without transferring bytes that would be thrown away. Dead
+        # pages take a status branch, not the exception machinery —
+        # try/except stays for genuine transport errors only.
         try:
-            response = self.session.get(url, timeout=15)
-            response.raise_for_status()
-        except requests.RequestException as e:
+            response = self.session.get(url, timeout=15, stream=True)
+            if response.status_code >= 400:
+                response.close()
+                return {
+                    'url': url,
+                    'domain': extract_domain(url),
+                    'link_status': 'dead',
+                }
+            content_type = response.headers.get('Content-Type', '')
+            if 'text/html' not in content_type:
+                response.close()
+                return _build_page_metadata(url, content_type, b'')
+            content = _read_body_capped(response)
+        except requests.RequestException:
             return {
                 'url': url,
                 'domain': extract_domain(url),
                 'link_status': 'dead',
             }
-        
-        # Check content type
-        content_type = response.headers.get('Content-Type', '')
-        if 'text/html' not in content_type:
-            # Not an HTML page, return basic info
-            return {
-                'url': url,
-                'domain': extract_domain(url),
-                'title': url.split('/')[-1] or 'Non-HTML Content',
-                'description': f"Non-HTML content: {content_type}",
-                'date': None,
-                'content_type': content_type,
-                'link_status': 'ok',
-            }
 
-        soup = BeautifulSoup(response.text, 'lxml')
-
-        metadata = {
-            'url': url,
-            'domain': extract_domain(url),
-            'title': extract_title(soup),
-            'description': clean_text(extract_meta_description(soup), max_length=300),
-            'date': extract_date(soup),
-            'content_type': content_type,
-            'link_status': 'ok',
-        }
-
-        # Content analysis — best-effort, don't fail the whole enrichment
-        try:
-            analysis = analyze_page_content(soup)
-            metadata.update({
-                'word_count': analysis['word_count'],
-                'depth': analysis['depth'],
-                'code_blocks': analysis['code_blocks'],
-                'technical_markers': analysis['technical_markers'],
-                'content_focus': analysis['content_focus'],
-                'marker_summary': analysis['marker_summary'],
-            })
-        except Exception:
-            metadata.update({
-                'word_count': 0,
-                'depth': 'Unknown',
-                'code_blocks': 0,
-                'technical_markers': {},
-                'content_focus': [],
-                'marker_summary': '',
-            })
-
-        return metadata
+        return _build_page_metadata(url, content_type, content)
     
-    def fetch_multiple(self, urls: List[str]) -> List[Dict]:
+    def fetch_multiple(
+        self, urls: List[str], max_concurrency: int = 20
+    ) -> List[Dict]:
         """
         Fetch metadata from multiple URLs.
-        
+
+        With aiohttp installed the whole batch runs concurrently on one
+        event loop (wall time ~ the slowest fetch); parsing runs in the
+        parse pool so it doesn't stall the loop. Otherwise URLs
+        are bucketed by domain and fetched across domains in a thread
+        pool, each bucket draining serially under its domain's limiter.
+
         Args:
             urls: List of URLs to fetch
-            
+
         Returns:
-            List of metadata dictionaries
+            List of metadata dictionaries (input order preserved)
         """
-        results = []
-        for url in urls:
-            metadata = self.fetch_page_metadata(url)
-            if metadata:
-                results.append(metadata)
-        return results
+        if AIOHTTP_AVAILABLE:
+            user_agent = self.session.headers.get('User-Agent', '')
+            slots = asyncio.run(
+                _gather_metadata(urls, user_agent, max_concurrency)
+            )
+            return [m for m in slots if m]
+
+        buckets: Dict[str, List[tuple]] = {}
+        for idx, url in enumerate(urls):
+            buckets.setdefault(extract_domain(url), []).append((idx, url))
+
+        slots: List[Optional[Dict]] = [None] * len(urls)
+
+        def drain(bucket):
+            for idx, url in bucket:
+                slots[idx] = self.fetch_page_metadata(url)
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            futures = [ex.submit(drain, b) for b in buckets.values()]
+            for fut in futures:
+                fut.result()
+
+        return [m for m in slots if m]
+
+
+def _build_page_metadata(url: str, content_type: str, content: bytes) -> Dict:
+    """
+    Build the fetch_page_metadata dict from an already-fetched body.
+
+    Both parses take the raw bytes directly — lxml sniffs the charset in
+    C, so the body is never decoded to an intermediate Python str.
+    """
+    if 'text/html' not in content_type:
+        # Not an HTML page, return basic info
+        return {
+            'url': url,
+            'domain': extract_domain(url),
+            'title': url.split('/')[-1] or 'Non-HTML Content',
+            'description': f"Non-HTML content: {content_type}",
+            'date': None,
+            'content_type': content_type,
+            'link_status': 'ok',
+        }
+
+    # Metadata comes from compiled XPaths over a C-level lxml parse;
+    # the BeautifulSoup tree is only built for content analysis below.
+    fields = extract_page_metadata(content)
+    metadata = {
+        'url': url,
+        'domain': extract_domain(url),
+        'title': fields['title'],
+        'description': clean_text(fields['description'], max_length=300),
+        'date': fields['date'],
+        'content_type': content_type,
+        'link_status': 'ok',
+    }
+
+    # Content analysis — best-effort, don't fail the whole enrichment
+    try:
+        soup = BeautifulSoup(content, 'lxml', parse_only=_ANALYSIS_STRAINER)
+        analysis = analyze_page_content(soup)
+        metadata.update({
+            'word_count': analysis['word_count'],
+            'depth': analysis['depth'],
+            'code_blocks': analysis['code_blocks'],
+            'technical_markers': analysis['technical_markers'],
+            'content_focus': analysis['content_focus'],
+            'marker_summary': analysis['marker_summary'],
+        })
+    except Exception:
+        metadata.update({
+            'word_count': 0,
+            'depth': 'Unknown',
+            'code_blocks': 0,
+            'technical_markers': {},
+            'content_focus': [],
+            'marker_summary': '',
+        })
+
+    return metadata
+
+
+async def _read_async_capped(resp) -> bytes:
+    """Read an aiohttp body under the same size caps as _read_body_capped."""
+    try:
+        declared = int(resp.headers.get('Content-Length') or 0)
+    except ValueError:
+        declared = 0
+    cap = _OVERSIZE_PREFIX if declared > _BODY_CAP else _BODY_CAP
+    return await resp.content.read(cap)
+
+
+async def _gather_metadata(
+    urls: List[str], user_agent: str = "", max_concurrency: int = 20
+) -> List[Optional[Dict]]:
+    """
+    Fetch page metadata for a batch of URLs on one event loop.
+
+    The semaphore bounds in-flight requests — past ~20 outstanding
+    sockets, extra coroutines just deepen kernel queues and convert
+    slow responses into timeouts. The connector additionally caps
+    per-host sockets so one slow origin can't monopolize the batch;
+    BeautifulSoup parsing runs in the process pool so it uses all
+    cores without stalling the loop.
+    """
+    sem = asyncio.BoundedSemaphore(max_concurrency)
+    limiter = AsyncRateLimiter(delay=2.0)
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=8)
+    timeout = aiohttp.ClientTimeout(total=15)
+    headers = {'User-Agent': user_agent or "TRR-Source-Scraper/1.0"}
+    loop = asyncio.get_running_loop()
+
+    async with aiohttp.ClientSession(
+        connector=connector, headers=headers
+    ) as session:
+
+        async def one(url: str) -> Optional[Dict]:
+            if not is_valid_url(url):
+                return None
+            domain = extract_domain(url)
+            await limiter.wait(domain)
+            try:
+                async with sem, session.get(url, timeout=timeout) as resp:
+                    if resp.status in (429, 503):
+                        limiter.backoff(domain, resp.headers)
+                    if resp.status >= 400:
+                        return {
+                            'url': url,
+                            'domain': domain,
+                            'link_status': 'dead',
+                        }
+                    content_type = resp.headers.get('Content-Type', '')
+                    body = await _read_async_capped(resp)
+            except Exception:
+                return {
+                    'url': url,
+                    'domain': extract_domain(url),
+                    'link_status': 'dead',
+                }
+            return await loop.run_in_executor(
+                _get_parse_pool(), _build_page_metadata, url, content_type, body
+            )
+
+        return list(await asyncio.gather(*(one(u) for u in urls)))
 
 
+_VIDEO_PLATFORM_DOMAINS = frozenset((
+    'youtube.com', 'www.youtube.com', 'm.youtube.com', 'youtu.be',
+    'vimeo.com', 'www.vimeo.com',
+))
+
+
+@lru_cache(maxsize=8192)
 def _is_video_platform_url(url: str) -> bool:
     """Check if a URL is from a video platform (YouTube, Vimeo, etc.)."""
-    domain = extract_domain(url)
-    return domain in (
-        'youtube.com', 'www.youtube.com', 'm.youtube.com', 'youtu.be',
-        'vimeo.com', 'www.vimeo.com',
-    )
+    return extract_domain(url) in _VIDEO_PLATFORM_DOMAINS
+
+
+# Platform suffix and earliest plausible separator break (at least 16
+# chars of title before it), each found in one C-level scan instead of
+# per-separator splits over a possibly 500+ char garbled title.
+_VIDEO_SUFFIX_RE = _re.compile(r'\s[-|]\s(?:YouTube|Vimeo)$')
+_TITLE_BREAK_RE = _re.compile(r'.{16,}?(?=\s[|\-–—]\s)')
 
 
 def _clean_video_title(title: str) -> str:
@@ -155,24 +422,22 @@ def _clean_video_title(title: str) -> str:
         return title
 
     # Strip common platform suffixes
-    for suffix in (' - YouTube', ' - Vimeo', ' | YouTube', ' | Vimeo'):
-        if title.endswith(suffix):
-            title = title[:-len(suffix)]
+    title = _VIDEO_SUFFIX_RE.sub('', title)
 
     # If still reasonable length, return as-is
     if len(title) <= 120:
         return title.strip()
 
-    # Try to find a natural break: separators that suggest concatenation
-    for separator in [' | ', ' - ', ' — ', ' – ']:
-        parts = title.split(separator, 2)
-        if len(parts) >= 2 and len(parts[0]) > 15:
-            return parts[0].strip()
+    # Truncate at the earliest separator that suggests concatenation
+    m = _TITLE_BREAK_RE.match(title)
+    if m:
+        return m.group(0).strip()
 
     # Last resort: hard truncate with ellipsis
     return title[:117].rsplit(' ', 1)[0] + '...'
 
 
+@lru_cache(maxsize=8192)
 def _github_raw_url(url: str) -> str | None:
     """
     Convert a GitHub blob URL to a raw.githubusercontent.com URL.
@@ -186,11 +451,7 @@ def _github_raw_url(url: str) -> str | None:
         github.com/SigmaHQ/sigma/blob/master/rules/win/foo.yml
         → raw.githubusercontent.com/SigmaHQ/sigma/master/rules/win/foo.yml
     """
-    m = _re.match(
-        r'https?://github\.com/([^/]+/[^/]+)/blob/(.+)',
-        url,
-        _re.IGNORECASE,
-    )
+    m = _GITHUB_BLOB_RE.match(url)
     if not m:
         return None
     repo = m.group(1)    # e.g. "SigmaHQ/sigma"
@@ -207,6 +468,13 @@ def _github_file_extension(url: str) -> str:
     return ''
 
 
+@lru_cache(maxsize=8192)
+def _is_pdf_url(url: str) -> bool:
+    """Check whether a URL points at a PDF (which can't be HTML-parsed)."""
+    url_low = url.lower()
+    return url_low.endswith('.pdf') or '/pdf/' in url_low
+
+
 def _needs_enrichment(result: Dict) -> bool:
     """
     Determine whether a search result needs metadata enrichment.
@@ -215,17 +483,22 @@ def _needs_enrichment(result: Dict) -> bool:
     - Always enrich: missing/garbled title, short description, video platforms
     - Never enrich: PDF URLs (cannot extract HTML metadata)
     - Skip if: title is reasonable and description is adequate (>100 chars)
+
+    Lengths and lowered strings are computed once — this runs per result
+    (sometimes twice) when enriching batches of thousands.
     """
     url = result.get('url', '')
     title = result.get('title', '')
     desc = result.get('description', '')
+    tlen = len(title)
+    dlen = len(desc)
 
     # Always enrich video platforms (DDG titles often garbled)
     if _is_video_platform_url(url):
         return True
 
     # Never enrich PDFs
-    if url.lower().endswith('.pdf') or '/pdf/' in url.lower():
+    if _is_pdf_url(url):
         return False
 
     # Missing title
@@ -233,11 +506,11 @@ def _needs_enrichment(result: Dict) -> bool:
         return True
 
     # Garbled title heuristics
-    if len(title) > 150 or title.count('|') >= 3:
+    if tlen > 150 or title.count('|') >= 3:
         return True
 
     # Missing or short description
-    if not desc or len(desc) < 80:
+    if dlen < 80:
         return True
 
     # DDG "Missing:" snippet — search engine couldn't find the query term
@@ -245,100 +518,247 @@ def _needs_enrichment(result: Dict) -> bool:
         return True
 
     # Already has adequate metadata
-    if len(title) < 150 and len(desc) > 100:
+    if tlen < 150 and dlen > 100:
         return False
 
     return True
 
 
-def enrich_search_results(
-    results: List[Dict],
-    user_agent: str = "",
-    js_rendered_domains: Optional[List[str]] = None,
-    verbose: bool = False,
-    pw_fetcher: Optional[object] = None,
-) -> List[Dict]:
+def _apply_analysis(result: Dict, analysis: Dict, grade: bool = True) -> None:
+    """Copy content-analysis fields onto a result, grading confidence."""
+    result['word_count'] = analysis['word_count']
+    result['depth'] = analysis['depth']
+    result['code_blocks'] = analysis['code_blocks']
+    result['technical_markers'] = analysis['technical_markers']
+    result['content_focus'] = analysis['content_focus']
+    result['marker_summary'] = analysis['marker_summary']
+    if not grade:
+        result['_analysis_confidence'] = 'analyzed'
+        return
+    wc = analysis['word_count']
+    if wc > 200:
+        result['_analysis_confidence'] = 'analyzed'
+    elif wc > 50:
+        result['_analysis_confidence'] = 'partial'
+    elif wc > 0:
+        result['_analysis_confidence'] = 'low'
+    else:
+        result['_analysis_confidence'] = 'empty'
+
+
+def _process_github_raw(result: Dict, raw_text: str) -> None:
+    """Apply raw-content metadata and analysis to a result, in place."""
+    url = result['url']
+    try:
+        result['link_status'] = 'ok'
+
+        # Metadata enrichment (only if needed)
+        if _needs_enrichment(result):
+            # For GitHub files, use filename as title fallback
+            filename = url.split('/')[-1]
+            if not result.get('title') or result['title'] == 'Untitled':
+                result['title'] = filename
+            result['_enrichment_status'] = 'enriched_raw'
+        else:
+            result['_enrichment_status'] = 'analyzed_raw'
+
+        # Content analysis on raw text
+        analysis = analyze_raw_text(
+            raw_text, file_extension=_github_file_extension(url)
+        )
+        _apply_analysis(result, analysis, grade=False)
+
+    except Exception:
+        result['link_status'] = 'dead'
+        result['_enrichment_status'] = 'failed'
+        result['_analysis_confidence'] = 'failed'
+
+
+def _enrich_github_raw(result: Dict, fetcher: SiteFetcher, raw_url: str) -> None:
+    """Fetch a GitHub blob's raw content and analyze it in place."""
+    fetcher.rate_limiter.wait(extract_domain(raw_url))
+    try:
+        if fetcher._client is not None:
+            # raw.githubusercontent.com speaks HTTP/2 — raw files for
+            # the whole batch share one multiplexed connection.
+            response = fetcher._client.get(raw_url)
+        else:
+            response = fetcher.session.get(raw_url, timeout=15)
+        failed = response.status_code >= 400
+    except Exception:
+        failed = True
+    if failed:
+        result['link_status'] = 'dead'
+        result['_enrichment_status'] = 'failed'
+        result['_analysis_confidence'] = 'failed'
+        return
+    _process_github_raw(result, response.text)
+
+
+def _process_static(result: Dict, content_type: str, content: bytes) -> None:
+    """Apply static-page metadata and content analysis, in place."""
+    result['link_status'] = 'ok'
+
+    if 'text/html' not in content_type:
+        result['_enrichment_status'] = 'skipped_nonhtml'
+        result['_analysis_confidence'] = 'not_fetched'
+        return
+
+    # Metadata: only overwrite if DDG metadata was bad. Fields come from
+    # compiled XPaths over an lxml parse — cheaper than a soup traversal.
+    if _needs_enrichment(result):
+        fields = extract_page_metadata(content)
+        result['title'] = fields['title']
+        result['description'] = clean_text(
+            fields['description'], max_length=300
+        )
+        result['date'] = fields['date']
+        result['_enrichment_status'] = 'enriched'
+    else:
+        result['_enrichment_status'] = 'analyzed'
+
+    soup = BeautifulSoup(content, 'lxml', parse_only=_ANALYSIS_STRAINER)
+
+    # Video title cleanup (always, if applicable)
+    if _is_video_platform_url(result['url']):
+        result['title'] = _clean_video_title(result.get('title', ''))
+
+    # Content analysis: ALWAYS runs on HTML pages
+    try:
+        _apply_analysis(result, analyze_page_content(soup))
+    except Exception:
+        # Analysis failure is non-fatal — result still usable
+        result['_analysis_confidence'] = 'failed'
+
+
+def _enrich_static(result: Dict, fetcher: SiteFetcher) -> None:
+    """Static GET + metadata/content analysis for one result, in place."""
+    url = result['url']
+    fetcher.rate_limiter.wait(extract_domain(url))
+    # Peek at Content-Type before reading the body (see fetch_page_metadata).
+    try:
+        response = fetcher.session.get(url, timeout=15, stream=True)
+        if response.status_code >= 400:
+            response.close()
+            result['link_status'] = 'dead'
+            result['_enrichment_status'] = 'failed'
+            result['_analysis_confidence'] = 'not_fetched'
+            return
+        content_type = response.headers.get('Content-Type', '')
+        if 'text/html' not in content_type:
+            response.close()
+            _process_static(result, content_type, b'')
+            return
+        content = _read_body_capped(response)
+    except Exception:
+        result['link_status'] = 'dead'
+        result['_enrichment_status'] = 'failed'
+        result['_analysis_confidence'] = 'not_fetched'
+        return
+    _process_static(result, content_type, content)
+
+
+async def _enrich_batch_async(
+    items: List[tuple], user_agent: str = "", max_concurrency: int = 20
+) -> None:
     """
-    Enrich search results with page metadata and content analysis.
+    Enrich (result, raw_url) pairs concurrently on one event loop.
 
-    Every HTML result gets an HTTP GET for content analysis (word count,
-    technical markers, focus tags). Metadata fields (title, description,
-    date) are only overwritten when _needs_enrichment() says the existing
-    metadata is inadequate.
+    Network round-trips overlap across the whole batch, bounded by the
+    semaphore (see _gather_metadata); parsing and analysis run in the
+    process pool (see _get_parse_pool) so they use all cores without
+    blocking the loop.
+    """
+    sem = asyncio.BoundedSemaphore(max_concurrency)
+    limiter = AsyncRateLimiter(delay=2.0)
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=8)
+    timeout = aiohttp.ClientTimeout(total=15)
+    headers = {'User-Agent': user_agent or "TRR-Source-Scraper/1.0"}
+    loop = asyncio.get_running_loop()
+
+    async with aiohttp.ClientSession(
+        connector=connector, headers=headers
+    ) as session:
+
+        async def one(result: Dict, raw_url: Optional[str]) -> None:
+            target = raw_url or result['url']
+            domain = extract_domain(target)
+            await limiter.wait(domain)
+            failed = False
+            try:
+                async with sem, session.get(target, timeout=timeout) as resp:
+                    if resp.status in (429, 503):
+                        limiter.backoff(domain, resp.headers)
+                    failed = resp.status >= 400
+                    if not failed:
+                        content_type = resp.headers.get('Content-Type', '')
+                        body = await _read_async_capped(resp)
+                        charset = resp.charset or 'utf-8'
+            except Exception:
+                failed = True
+            if failed:
+                result['link_status'] = 'dead'
+                result['_enrichment_status'] = 'failed'
+                result['_analysis_confidence'] = (
+                    'failed' if raw_url else 'not_fetched'
+                )
+                return
+            # Results cross the process boundary by value, so merge the
+            # returned dict back into the caller's reference.
+            if raw_url:
+                # Raw text analysis works on str; only this path decodes.
+                text = body.decode(charset, 'replace')
+                updated = await loop.run_in_executor(
+                    _get_parse_pool(), _process_github_raw_job, result, text
+                )
+            else:
+                updated = await loop.run_in_executor(
+                    _get_parse_pool(), _process_static_job,
+                    result, content_type, body,
+                )
+            result.update(updated)
 
-    Args:
-        pw_fetcher: Optional shared PlaywrightFetcher instance. When
-            provided, the caller owns the lifecycle (close). When None
-            and JS domains are configured, a fetcher is created and
-            closed within this call.
+        await asyncio.gather(*(one(r, ru) for r, ru in items))
+
+
+def _partition_results(
+    results: List[Dict], js_domains: set, playwright_available: bool
+) -> tuple:
     """
-    from scrapers.playwright_fetcher import PLAYWRIGHT_AVAILABLE, PlaywrightFetcher
+    Single pre-pass classifying results for enrichment.
 
-    fetcher = SiteFetcher(user_agent=user_agent)
-    enriched = []
+    PDFs and empty URLs are marked in place and never touch the network;
+    GitHub blobs are bucketed under raw.githubusercontent.com (sharing
+    one connection); JS-rendered domains queue for the serial Playwright
+    pass; everything else is bucketed by domain. Results mutate in
+    place, so output order is just the input list.
 
-    # Playwright: use shared instance or lazy-init a local one
-    js_domains = set(js_rendered_domains or [])
-    _pw_shared = pw_fetcher is not None  # caller owns lifecycle
-    pw_used_count = 0
+    Returns:
+        (buckets, js_queue) where buckets maps domain to a list of
+        (result, raw_url_or_None) pairs.
+    """
+    js_queue: List[Dict] = []
+    buckets: Dict[str, List[tuple]] = {}
 
     for result in results:
         url = result.get('url', '')
         if not url:
-            enriched.append(result)
             continue
 
         # Skip PDFs — can't parse HTML content
-        if url.lower().endswith('.pdf') or '/pdf/' in url.lower():
+        if _is_pdf_url(url):
             result.setdefault('link_status', 'ok')
             result['_enrichment_status'] = 'skipped_pdf'
             result['_analysis_confidence'] = 'not_fetched'
-            enriched.append(result)
             continue
 
         # GitHub blob URLs: fetch raw content instead of JS-rendered HTML
         raw_url = _github_raw_url(url)
         if raw_url:
-            needs_meta = _needs_enrichment(result)
-            fetcher.rate_limiter.wait()
-            try:
-                response = fetcher.session.get(raw_url, timeout=15)
-                response.raise_for_status()
-                raw_text = response.text
-                ext = _github_file_extension(url)
-
-                result['link_status'] = 'ok'
-
-                # Metadata enrichment (only if needed)
-                if needs_meta:
-                    # For GitHub files, use filename as title fallback
-                    filename = url.split('/')[-1]
-                    if not result.get('title') or result['title'] == 'Untitled':
-                        result['title'] = filename
-                    result['_enrichment_status'] = 'enriched_raw'
-                else:
-                    result['_enrichment_status'] = 'analyzed_raw'
-
-                # Content analysis on raw text
-                analysis = analyze_raw_text(raw_text, file_extension=ext)
-                result['word_count'] = analysis['word_count']
-                result['depth'] = analysis['depth']
-                result['code_blocks'] = analysis['code_blocks']
-                result['technical_markers'] = analysis['technical_markers']
-                result['content_focus'] = analysis['content_focus']
-                result['marker_summary'] = analysis['marker_summary']
-                result['_analysis_confidence'] = 'analyzed'
-
-            except Exception:
-                result['link_status'] = 'dead'
-                result['_enrichment_status'] = 'failed'
-                result['_analysis_confidence'] = 'failed'
-
-            enriched.append(result)
-            continue  # skip normal HTML fetch path
-
-        needs_meta = _needs_enrichment(result)
-        is_video = _is_video_platform_url(url)
+            buckets.setdefault(extract_domain(raw_url), []).append(
+                (result, raw_url)
+            )
+            continue
 
         # Check if this domain needs JS rendering via Playwright
         domain = extract_domain(url)
@@ -347,121 +767,111 @@ def enrich_search_results(
             bare_domain == d or bare_domain.endswith('.' + d)
             for d in js_domains
         )
+        if needs_js and playwright_available:
+            js_queue.append(result)
+        else:
+            buckets.setdefault(domain, []).append((result, None))
 
-        if needs_js and PLAYWRIGHT_AVAILABLE:
-            if pw_fetcher is None:
-                pw_fetcher = PlaywrightFetcher()  # local instance, will close below
-            fetcher.rate_limiter.wait()
-            html = pw_fetcher.fetch_page_html(url)
-            if html:
-                soup = BeautifulSoup(html, 'lxml')
-                result['link_status'] = 'ok'
-
-                # Metadata enrichment (only if needed)
-                if needs_meta:
-                    result['title'] = extract_title(soup)
-                    result['description'] = clean_text(
-                        extract_meta_description(soup), max_length=300
-                    )
-                    result['date'] = extract_date(soup)
-                    result['_enrichment_status'] = 'playwright'
-                else:
-                    result['_enrichment_status'] = 'playwright_analyzed'
+    return buckets, js_queue
 
-                # Video title cleanup
-                if is_video:
-                    result['title'] = _clean_video_title(result.get('title', ''))
 
-                # Content analysis on JS-rendered page
-                try:
-                    analysis = analyze_page_content(soup)
-                    result['word_count'] = analysis['word_count']
-                    result['depth'] = analysis['depth']
-                    result['code_blocks'] = analysis['code_blocks']
-                    result['technical_markers'] = analysis['technical_markers']
-                    result['content_focus'] = analysis['content_focus']
-                    result['marker_summary'] = analysis['marker_summary']
-
-                    wc = analysis['word_count']
-                    if wc > 200:
-                        result['_analysis_confidence'] = 'analyzed'
-                    elif wc > 50:
-                        result['_analysis_confidence'] = 'partial'
-                    elif wc > 0:
-                        result['_analysis_confidence'] = 'low'
-                    else:
-                        result['_analysis_confidence'] = 'empty'
-                except Exception:
-                    result['_analysis_confidence'] = 'failed'
+def enrich_search_results(
+    results: List[Dict],
+    user_agent: str = "",
+    js_rendered_domains: Optional[List[str]] = None,
+    verbose: bool = False,
+    pw_fetcher: Optional[object] = None,
+    max_concurrency: int = 20,
+) -> List[Dict]:
+    """
+    Enrich search results with page metadata and content analysis.
 
-                enriched.append(result)
-                pw_used_count += 1
-                continue
-            # Playwright failed — fall through to static fetch
+    Every HTML result gets an HTTP GET for content analysis (word count,
+    technical markers, focus tags). Metadata fields (title, description,
+    date) are only overwritten when _needs_enrichment() says the existing
+    metadata is inadequate.
 
-        # ALWAYS fetch the page (for content analysis)
-        fetcher.rate_limiter.wait()
-        try:
-            response = fetcher.session.get(url, timeout=15)
-            response.raise_for_status()
-        except Exception:
-            result['link_status'] = 'dead'
-            result['_enrichment_status'] = 'failed'
-            result['_analysis_confidence'] = 'not_fetched'
-            enriched.append(result)
-            continue
+    With aiohttp installed, static and raw fetches for the whole batch
+    overlap on one event loop (per-host sockets capped at 8); otherwise
+    they run on a domain-bucketed thread pool, each bucket draining
+    serially under its domain's rate limiter. Playwright pages render
+    serially (the sync API is single-threaded).
 
-        content_type = response.headers.get('Content-Type', '')
-        result['link_status'] = 'ok'
+    Args:
+        pw_fetcher: Optional shared PlaywrightFetcher instance. When
+            provided, the caller owns the lifecycle (close). When None
+            and JS domains are configured, a fetcher is created and
+            closed within this call.
+    """
+    from scrapers.playwright_fetcher import PLAYWRIGHT_AVAILABLE, PlaywrightFetcher
 
-        if 'text/html' not in content_type:
-            result['_enrichment_status'] = 'skipped_nonhtml'
-            result['_analysis_confidence'] = 'not_fetched'
-            enriched.append(result)
+    fetcher = SiteFetcher(user_agent=user_agent)
+
+    # Playwright: use shared instance or lazy-init a local one
+    js_domains = set(js_rendered_domains or [])
+    _pw_shared = pw_fetcher is not None  # caller owns lifecycle
+    pw_used_count = 0
+
+    buckets, js_queue = _partition_results(
+        results, js_domains, PLAYWRIGHT_AVAILABLE
+    )
+
+    if AIOHTTP_AVAILABLE:
+        items = [pair for bucket in buckets.values() for pair in bucket]
+        if items:
+            asyncio.run(
+                _enrich_batch_async(items, user_agent, max_concurrency)
+            )
+    else:
+        def drain(bucket):
+            for result, raw_url in bucket:
+                if raw_url:
+                    _enrich_github_raw(result, fetcher, raw_url)
+                else:
+                    _enrich_static(result, fetcher)
+
+        with ThreadPoolExecutor(max_workers=8) as ex:
+            futures = [ex.submit(drain, b) for b in buckets.values()]
+            for fut in futures:
+                fut.result()
+
+    for result in js_queue:
+        url = result['url']
+        if pw_fetcher is None:
+            pw_fetcher = PlaywrightFetcher()  # local instance, will close below
+        fetcher.rate_limiter.wait(extract_domain(url))
+        html = pw_fetcher.fetch_page_html(url)
+        if not html:
+            # Playwright failed — fall back to static fetch
+            _enrich_static(result, fetcher)
             continue
 
-        soup = BeautifulSoup(response.text, 'lxml')
+        result['link_status'] = 'ok'
 
-        # Metadata: only overwrite if DDG metadata was bad
-        if needs_meta:
-            result['title'] = extract_title(soup)
+        # Metadata enrichment (only if needed)
+        if _needs_enrichment(result):
+            fields = extract_page_metadata(html)
+            result['title'] = fields['title']
             result['description'] = clean_text(
-                extract_meta_description(soup), max_length=300
+                fields['description'], max_length=300
             )
-            result['date'] = extract_date(soup)
-            result['_enrichment_status'] = 'enriched'
+            result['date'] = fields['date']
+            result['_enrichment_status'] = 'playwright'
         else:
-            result['_enrichment_status'] = 'analyzed'
+            result['_enrichment_status'] = 'playwright_analyzed'
+
+        soup = BeautifulSoup(html, 'lxml', parse_only=_ANALYSIS_STRAINER)
 
-        # Video title cleanup (always, if applicable)
-        if is_video:
+        # Video title cleanup
+        if _is_video_platform_url(url):
             result['title'] = _clean_video_title(result.get('title', ''))
 
-        # Content analysis: ALWAYS runs on HTML pages
+        # Content analysis on JS-rendered page
         try:
-            analysis = analyze_page_content(soup)
-            result['word_count'] = analysis['word_count']
-            result['depth'] = analysis['depth']
-            result['code_blocks'] = analysis['code_blocks']
-            result['technical_markers'] = analysis['technical_markers']
-            result['content_focus'] = analysis['content_focus']
-            result['marker_summary'] = analysis['marker_summary']
-
-            # Set analysis confidence based on extracted word count
-            wc = analysis['word_count']
-            if wc > 200:
-                result['_analysis_confidence'] = 'analyzed'
-            elif wc > 50:
-                result['_analysis_confidence'] = 'partial'
-            elif wc > 0:
-                result['_analysis_confidence'] = 'low'
-            else:
-                result['_analysis_confidence'] = 'empty'
+            _apply_analysis(result, analyze_page_content(soup))
         except Exception:
-            # Analysis failure is non-fatal — result still usable
             result['_analysis_confidence'] = 'failed'
-
-        enriched.append(result)
+        pw_used_count += 1
 
     # Clean up Playwright browser if we created a local instance
     if pw_fetcher and not _pw_shared:
@@ -469,7 +879,36 @@ def enrich_search_results(
     if pw_used_count and verbose:
         print(f"  [playwright] Rendered {pw_used_count} JS pages")
 
-    return enriched
+    return results
+
+
+async def _validate_async(
+    urls: List[str], user_agent: str = "", concurrency: int = 50
+) -> List[bool]:
+    """
+    Probe URLs with concurrent HEAD requests on one event loop.
+
+    Validation is pure I/O — one round-trip per URL — so the event loop
+    runs the whole batch in roughly the latency of the slowest probe.
+    The semaphore bounds in-flight requests.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    timeout = aiohttp.ClientTimeout(total=10)
+    headers = {'User-Agent': user_agent or "TRR-Source-Scraper/1.0"}
+
+    async with aiohttp.ClientSession(headers=headers) as session:
+
+        async def probe(url: str) -> bool:
+            async with sem:
+                try:
+                    async with session.head(
+                        url, allow_redirects=True, timeout=timeout
+                    ) as resp:
+                        return resp.status < 400
+                except Exception:
+                    return False
+
+        return list(await asyncio.gather(*(probe(u) for u in urls)))
 
 
 def validate_search_result_links(results: List[Dict], user_agent: str = "") -> List[Dict]:
@@ -477,11 +916,41 @@ def validate_search_result_links(results: List[Dict], user_agent: str = "") -> L
     Lightweight link validation via HEAD requests (no page content fetched).
 
     Useful with --no-enrich --validate-links to check liveness without
-    the overhead of full metadata enrichment.
+    the overhead of full metadata enrichment. With aiohttp installed the
+    whole batch runs concurrently on one event loop; otherwise HEADs run
+    on the domain-bucketed thread pool.
     """
+    if AIOHTTP_AVAILABLE:
+        probed = [r for r in results if is_valid_url(r.get('url', ''))]
+        for result in results:
+            if result.get('url') and not is_valid_url(result['url']):
+                result['link_status'] = 'dead'
+        if probed:
+            statuses = asyncio.run(
+                _validate_async([r['url'] for r in probed], user_agent)
+            )
+            for result, ok in zip(probed, statuses):
+                result['link_status'] = 'ok' if ok else 'dead'
+        return results
+
     fetcher = SiteFetcher(user_agent=user_agent)
+
+    buckets: Dict[str, List[Dict]] = {}
     for result in results:
         url = result.get('url', '')
         if url:
+            buckets.setdefault(extract_domain(url), []).append(result)
+
+    def drain(bucket):
+        for result in bucket:
+            url = result['url']
             result['link_status'] = 'ok' if fetcher.validate_url(url) else 'dead'
+
+    # HEAD checks parallelize across domains; each domain stays serial
+    # under its own rate limiter.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        futures = [ex.submit(drain, b) for b in buckets.values()]
+        for fut in futures:
+            fut.result()
+
     return results
\ No newline at end of file
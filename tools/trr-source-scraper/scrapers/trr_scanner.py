@@ -0,0 +1,914 @@
+"""
+Existing-TRR scanner for finding already-written reports covering a technique.
+
+Checks the local working tree (Completed TRR Reports, WIP TRRs) and optionally
+a published GitHub repository for TRRs and DDM files related to a technique ID.
+Used to front-load researcher context — adjacent TRRs (same parent technique,
+overlapping technique name) are surfaced before new scoping work begins.
+"""
+
+import hashlib
+import json
+import mmap
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Pattern
+from urllib.parse import quote
+
+import requests
+
+try:
+    import ahocorasick_rs
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import httpx
+    # Fetch failures may surface as either library's exception depending
+    # on which client handled the request.
+    _FETCH_ERRORS = (requests.RequestException, httpx.HTTPError)
+except ImportError:
+    _FETCH_ERRORS = (requests.RequestException,)
+
+from utils import create_session
+from utils.helpers import create_http2_client
+
+
+GITHUB_API = "https://api.github.com"
+RAW_BASE = "https://raw.githubusercontent.com"
+
+# Words in technique names too generic to signal a related TRR on their own
+_NAME_STOPWORDS = {
+    'component', 'software', 'service', 'services', 'system', 'windows',
+    'application', 'data', 'remote', 'local', 'account', 'accounts',
+}
+
+# Extraction patterns compiled once at import — these run against every
+# README a scan touches, so per-call compilation adds up fast.
+# The labelled TRR-ID forms and the bare-ID fallback are one alternation:
+# one pass over the content either finds an ID or rejects the file.
+_TRR_ID_RE = re.compile(
+    r'(?:TRR\s*ID[:\s]+|\*\*ID\*\*[:\s]*|\|\s*ID\s*\|\s*)(TRR\d+)'
+    r'|\b(TRR\d{4})\b',
+    re.IGNORECASE,
+)
+_TECHNIQUE_ID_RE = re.compile(r'\b(T\d{4}(?:\.\d{3})?)\b')
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_REF_SECTION_RE = re.compile(r'^##\s*References\s*$(.*)',
+                             re.IGNORECASE | re.MULTILINE | re.DOTALL)
+_LINK_RE = re.compile(r'\[([^\]]+)\]\((https?://[^)]+)\)')
+
+# Fused extraction pattern: TRR ID, technique IDs, and the H1 title are
+# pulled out in a single walk over the content instead of one full scan
+# per field. Dispatch is on Match.lastgroup.
+# IGNORECASE is scoped to the TRR-ID alternative: technique IDs are
+# case-sensitive (_TECHNIQUE_ID_RE), and a global flag would admit
+# lowercase ids like 't1574' from URLs that then fail canonical
+# ATT&CK-ID comparisons downstream.
+_COMBINED_EXTRACT_RE = re.compile(
+    r'(?P<trr_id>(?i:(?:TRR\s*ID[:\s]+|\*\*ID\*\*[:\s]*|\|\s*ID\s*\|\s*)TRR\d+'
+    r'|\bTRR\d{4}\b))'
+    r'|(?P<tech>\bT\d{4}(?:\.\d{3})?\b)'
+    r'|(?P<title>^#\s+.+$)',
+    re.MULTILINE,
+)
+
+
+def _extract_report_fields(content: str) -> tuple:
+    """
+    Extract (trr_id, title, technique_ids) in one pass over the content.
+
+    Equivalent to _extract_trr_id + _extract_title + _extract_technique_ids
+    but walks the file text once — the extractors are memory-bandwidth-bound
+    on large READMEs, so fusing them matters.
+    """
+    trr_id = None
+    title = ''
+    seen = set()
+    technique_ids = []
+    for m in _COMBINED_EXTRACT_RE.finditer(content):
+        kind = m.lastgroup
+        if kind == 'tech':
+            tid = m.group('tech')
+            if tid not in seen:
+                seen.add(tid)
+                technique_ids.append(tid)
+        elif kind == 'trr_id':
+            if trr_id is None:
+                mm = _TRR_ID_RE.match(m.group('trr_id'))
+                if mm:
+                    trr_id = (mm.group(1) or mm.group(2)).upper()
+        elif kind == 'title':
+            line = m.group('title')
+            if not title:
+                title = line.lstrip('#').strip()
+            # The title alternative consumes the whole heading line, and
+            # H1s routinely carry the IDs ('# TRR0017: ... (T1505.003)')
+            # — re-scan just the line so they aren't lost.
+            for tid in _TECHNIQUE_ID_RE.findall(line):
+                if tid not in seen:
+                    seen.add(tid)
+                    technique_ids.append(tid)
+            if trr_id is None:
+                mm = _TRR_ID_RE.search(line)
+                if mm:
+                    trr_id = (mm.group(1) or mm.group(2)).upper()
+    return trr_id, title, technique_ids
+
+
+def _extract_trr_id(content: str) -> Optional[str]:
+    """Extract a TRR identifier (e.g. 'TRR0017') from report content."""
+    m = _TRR_ID_RE.search(content)
+    if m:
+        return (m.group(1) or m.group(2)).upper()
+    return None
+
+
+def _extract_technique_ids(content: str) -> List[str]:
+    """Extract all ATT&CK technique IDs mentioned in report content."""
+    seen = set()
+    ids = []
+    for tid in _TECHNIQUE_ID_RE.findall(content):
+        if tid not in seen:
+            seen.add(tid)
+            ids.append(tid)
+    return ids
+
+
+def _extract_title(content: str) -> str:
+    """Extract the first markdown H1 title from report content."""
+    m = _TITLE_RE.search(content)
+    return m.group(1).strip() if m else ''
+
+
+def _extract_references(content: str, max_refs: int = 10) -> List[Dict]:
+    """Extract reference links from the report's References section."""
+    # Locate the header by offset first — skips the DOTALL scan across the
+    # whole file in the common case, and entirely when the section is absent.
+    idx = content.find('## References')
+    if idx != -1:
+        section = content[idx:]
+    else:
+        m = _REF_SECTION_RE.search(content)
+        if not m:
+            return []
+        section = m.group(1)
+    refs = []
+    for name, url in _LINK_RE.findall(section):
+        refs.append({'name': name, 'url': url})
+        if len(refs) >= max_refs:
+            break
+    return refs
+
+
+@dataclass
+class TechniqueMatcher:
+    """
+    Compiled per-technique match patterns.
+
+    Built once per scan so the technique/parent/name patterns are not
+    recompiled for every README checked — compilation cost dominates when
+    the matcher runs against hundreds of small files.
+    """
+    technique_id: str
+    parent_id: str
+    matching_name: str
+    technique_re: Pattern
+    parent_re: Optional[Pattern]
+    phrase_re: Optional[Pattern]
+    word_res: List[Pattern]
+    threshold: int
+    # Aho-Corasick automaton over the name words — one O(N) pass instead
+    # of one regex scan per word. None when unavailable or not worthwhile.
+    word_automaton: Optional[object] = None
+    word_count: int = 0
+    # Bytes-level necessary condition for any match type: the technique
+    # ID, parent ID, or at least one name word must appear. Runs against
+    # raw bytes (e.g. an mmap) before any decode.
+    prefilter_bytes_re: Optional[Pattern] = None
+
+
+def _is_word_char(ch: str) -> bool:
+    """Equivalent of regex \\w for the automaton boundary check."""
+    return ch.isalnum() or ch == '_'
+
+
+def _count_automaton_words(
+    content_lower: str, automaton: object, word_count: int
+) -> int:
+    """
+    Count distinct name words found by the Aho-Corasick automaton.
+
+    Each hit is verified against the surrounding characters to preserve
+    the \\b semantics of the per-word regex path.
+    """
+    matched = set()
+    for pattern_idx, start, end in automaton.find_matches_as_indexes(
+        content_lower
+    ):
+        if pattern_idx in matched:
+            continue
+        if start > 0 and _is_word_char(content_lower[start - 1]):
+            continue
+        if end < len(content_lower) and _is_word_char(content_lower[end]):
+            continue
+        matched.add(pattern_idx)
+        if len(matched) == word_count:
+            break
+    return len(matched)
+
+
+def make_technique_id_scanner(known_ids) -> Callable[[str], set]:
+    """
+    Build a one-pass scanner for a fixed set of ATT&CK technique IDs.
+
+    With ahocorasick_rs installed, all IDs are matched in a single
+    automaton walk per document — scanning N techniques against M files
+    stays linear in M instead of N×M regex passes. Hits are verified
+    against surrounding characters to keep the regex \\b semantics.
+    Falls back to one generic-pattern scan intersected with the known
+    set. Returns a callable content -> set of IDs found.
+    """
+    ids = [i for i in known_ids if i]
+    if AHOCORASICK_AVAILABLE and ids:
+        automaton = ahocorasick_rs.AhoCorasick(
+            ids, matchkind=ahocorasick_rs.MatchKind.LeftmostLongest
+        )
+
+        def scan(content: str) -> set:
+            found = set()
+            for idx, start, end in automaton.find_matches_as_indexes(
+                content
+            ):
+                if start > 0 and _is_word_char(content[start - 1]):
+                    continue
+                if end < len(content) and _is_word_char(content[end]):
+                    continue
+                found.add(ids[idx])
+            return found
+
+        return scan
+
+    id_set = frozenset(ids)
+
+    def scan(content: str) -> set:
+        hits = set(_TECHNIQUE_ID_RE.findall(content))
+        return hits & id_set if id_set else hits
+
+    return scan
+
+
+@lru_cache(maxsize=4096)
+def _word_re(word: str) -> Pattern:
+    """
+    Compile (and cache) a word-boundary pattern for one lowered term.
+
+    Long sessions scan many techniques whose names share common words;
+    the cache keeps those compiled objects alive across matchers instead
+    of recompiling per technique.
+    """
+    return re.compile(rf'\b{re.escape(word)}\b')
+
+
+def _compile_matcher(
+    technique_id: str, parent_id: str, technique_name: str = ""
+) -> TechniqueMatcher:
+    """Build a TechniqueMatcher with all patterns compiled up front."""
+    # For sub-techniques, match on the short name after the colon
+    matching_name = (
+        technique_name.split(':')[-1].strip().lower()
+        if ':' in technique_name
+        else technique_name.lower()
+    )
+    name_words = [
+        w for w in re.split(r'\W+', matching_name)
+        if len(w) > 3 and w not in _NAME_STOPWORDS
+    ]
+    return TechniqueMatcher(
+        technique_id=technique_id,
+        parent_id=parent_id,
+        matching_name=matching_name,
+        technique_re=_word_re(technique_id.lower()),
+        parent_re=_word_re(parent_id.lower()) if parent_id else None,
+        phrase_re=_word_re(matching_name) if matching_name else None,
+        word_res=(
+            [_word_re(w) for w in name_words]
+            if len(name_words) >= 2 else []
+        ),
+        threshold=max(2, len(name_words) - 1),
+        word_automaton=(
+            ahocorasick_rs.AhoCorasick(
+                name_words, matchkind=ahocorasick_rs.MatchKind.Standard
+            )
+            if AHOCORASICK_AVAILABLE and len(name_words) > 3 else None
+        ),
+        word_count=len(name_words),
+        prefilter_bytes_re=re.compile(
+            b'|'.join(
+                re.escape(part.encode('utf-8'))
+                for part in [technique_id, parent_id, matching_name,
+                             *name_words] if part
+            ),
+            re.IGNORECASE,
+        ),
+    )
+
+
+def _match_with_matcher(
+    content: str,
+    matcher: TechniqueMatcher,
+    content_lower: Optional[str] = None,
+) -> Optional[Dict]:
+    """
+    Check report content for a relationship to the target technique.
+
+    Match types, strongest first:
+      'exact'  — the exact technique ID appears
+      'parent' — the parent technique ID appears (sub-technique sibling)
+      'name'   — the technique name (or most of its meaningful words) appears
+
+    Callers that already hold a lowered copy of the content pass it in so
+    it is not rebuilt here. All patterns are compiled lowercase and run
+    against the lowered view — one casefold pass instead of the regex
+    engine folding again under IGNORECASE.
+
+    Returns a dict with match_type, trr_id, title, technique_ids, and
+    references, or None when unrelated.
+    """
+    # Cheap substring prefilter: one linear scan rejects the vast majority
+    # of files before the word-boundary regex ever runs.
+    if content_lower is None:
+        content_lower = content.lower()
+    match_type = None
+    if (matcher.technique_id.lower() in content_lower
+            and matcher.technique_re.search(content_lower)):
+        match_type = 'exact'
+    elif (matcher.parent_re
+            and matcher.parent_id.lower() in content_lower
+            and matcher.parent_re.search(content_lower)):
+        match_type = 'parent'
+    elif matcher.matching_name:
+        if matcher.phrase_re and matcher.phrase_re.search(content_lower):
+            match_type = 'name'
+        elif matcher.word_res:
+            # Partial match: most meaningful name words present
+            if matcher.word_automaton is not None:
+                matched = _count_automaton_words(
+                    content_lower, matcher.word_automaton, matcher.word_count
+                )
+            else:
+                matched = sum(
+                    1 for word_re in matcher.word_res
+                    if word_re.search(content_lower)
+                )
+            if matched >= matcher.threshold:
+                match_type = 'name'
+
+    if not match_type:
+        return None
+
+    trr_id, title, technique_ids = _extract_report_fields(content)
+    return {
+        'match_type': match_type,
+        'trr_id': trr_id,
+        'title': title,
+        'technique_ids': technique_ids,
+        'references': _extract_references(content),
+    }
+
+
+class GitHubTRRScanner:
+    """
+    Scans a published TRR repository on GitHub for existing reports.
+
+    Uses the Git Trees API to enumerate report paths, then fetches README
+    and DDM content from raw.githubusercontent.com. README fetches run in
+    a thread pool — the workload is network-latency-bound, so overlapping
+    the HTTPS round-trips cuts wall time roughly by the worker count.
+    """
+
+    def __init__(
+        self,
+        repo: str = "McBeer89/TL-McBeer-Repo",
+        branch: str = "main",
+        reports_path: str = "Completed TRR Reports",
+        user_agent: str = "TRR-Source-Scraper/1.0",
+        max_workers: int = 16,
+    ):
+        self.repo = repo
+        self.branch = branch
+        self.reports_path = reports_path
+        self.max_workers = max_workers
+        # create_session pools are already sized above the fetch thread
+        # pool, so concurrent GETs reuse keep-alive connections.
+        self.session = create_session(user_agent)
+        # With httpx installed, all scanner traffic multiplexes over one
+        # HTTP/2 connection per host; otherwise the pooled requests
+        # session above handles everything.
+        self._client = create_http2_client(user_agent)
+        self._tree: Optional[List[Dict]] = None
+        self._tree_etag: Optional[str] = None
+        # Persistent cache keyed by branch-tip commit SHA — repeated runs
+        # against an unchanged branch skip the network entirely.
+        self.cache_root = (
+            Path.home() / '.cache' / 'trr-scraper' / self.repo.replace('/', '_')
+        )
+        self._cache_dir: Optional[Path] = None
+        self._cache_checked = False
+        self._blob_shas: Dict[str, str] = {}
+        self._readmes: List[str] = []
+        self._ddms: List[str] = []
+        # path → ETag sidecar for conditional GETs. A 304 skips the body
+        # bytes and, on the API, doesn't count against the rate limit.
+        self._etags: Optional[Dict[str, str]] = None
+        self._etags_lock = threading.Lock()
+        self._etags_dirty = False
+
+    def _load_etags(self) -> Dict[str, str]:
+        """Load the path → ETag sidecar (lazily, once per instance)."""
+        if self._etags is None:
+            try:
+                self._etags = json.loads(
+                    (self.cache_root / 'etags.json').read_text(encoding='utf-8')
+                )
+            except (OSError, ValueError):
+                self._etags = {}
+        return self._etags
+
+    def _record_etag(self, key: str, etag: Optional[str]) -> None:
+        """Remember an ETag from a 200 response (thread-safe)."""
+        if not etag:
+            return
+        with self._etags_lock:
+            etags = self._load_etags()
+            if etags.get(key) != etag:
+                etags[key] = etag
+                self._etags_dirty = True
+
+    def _save_etags(self) -> None:
+        """Flush the ETag sidecar to disk if it changed (best-effort)."""
+        with self._etags_lock:
+            if not self._etags_dirty or self._etags is None:
+                return
+            try:
+                self.cache_root.mkdir(parents=True, exist_ok=True)
+                (self.cache_root / 'etags.json').write_text(
+                    json.dumps(self._etags), encoding='utf-8'
+                )
+                self._etags_dirty = False
+            except OSError:
+                pass  # Sidecar write failure is non-fatal
+
+    def _http_get(self, url: str, headers: Optional[Dict] = None):
+        """GET via the HTTP/2 client when available, else the session."""
+        if self._client is not None:
+            return self._client.get(url, headers=headers)
+        return self.session.get(url, timeout=15, headers=headers)
+
+    def _get_cache_dir(self) -> Optional[Path]:
+        """Resolve the branch-tip SHA once and return its cache directory."""
+        if self._cache_checked:
+            return self._cache_dir
+        self._cache_checked = True
+        url = f"{GITHUB_API}/repos/{self.repo}/branches/{self.branch}"
+        try:
+            r = self._http_get(url)
+            r.raise_for_status()
+            sha = r.json().get('commit', {}).get('sha', '')
+        except (*_FETCH_ERRORS, ValueError):
+            sha = ''
+        if sha:
+            cache_dir = self.cache_root / sha
+            try:
+                cache_dir.mkdir(parents=True, exist_ok=True)
+                self._cache_dir = cache_dir
+            except OSError:
+                self._cache_dir = None
+        return self._cache_dir
+
+    def _index_tree(self, tree: List[Dict]) -> None:
+        """
+        Partition the tree into indexed buckets in a single walk.
+
+        Records blob SHAs (for the cross-commit file cache) and splits
+        blob paths into README and DDM lists once, so the per-scan list
+        comprehensions over tens of thousands of entries go away.
+        """
+        blob_shas: Dict[str, str] = {}
+        readmes: List[str] = []
+        ddms: List[str] = []
+        for e in tree:
+            if e.get('type') != 'blob':
+                continue
+            path = e['path']
+            if e.get('sha'):
+                blob_shas[path] = e['sha']
+            if path.endswith('README.md') and path.startswith(self.reports_path):
+                readmes.append(path)
+            elif path.endswith('.json') and '/ddms/' in path:
+                ddms.append(path)
+        self._blob_shas = blob_shas
+        self._readmes = readmes
+        self._ddms = ddms
+
+    def _get_tree(self, refresh: bool = False) -> List[Dict]:
+        """
+        Fetch the repo's full file tree (cached per instance).
+
+        One recursive Trees API call is the fast path. GitHub truncates
+        that response at ~100k entries / 7MB and sets "truncated": true —
+        silently dropping paths — so on truncation we fall back to a
+        bounded subtree fetch rooted at reports_path via the contents API.
+        """
+        if self._tree is not None and not refresh:
+            return self._tree
+
+        cache_dir = self._get_cache_dir()
+        if cache_dir and not refresh:
+            try:
+                cached = json.loads(
+                    (cache_dir / 'tree.json').read_text(encoding='utf-8')
+                )
+                self._index_tree(cached)
+                self._tree = cached
+                return self._tree
+            except (OSError, ValueError):
+                pass
+
+        url = f"{GITHUB_API}/repos/{self.repo}/git/trees/{self.branch}?recursive=1"
+        etag = self._tree_etag or self._load_etags().get('@tree')
+        headers = {'If-None-Match': etag} if etag else {}
+        try:
+            r = self._http_get(url, headers=headers)
+            if r.status_code == 304:
+                # Unchanged since last run — serve the persisted body.
+                # 304s on the API don't count against the rate limit.
+                if self._tree is not None:
+                    return self._tree
+                try:
+                    cached = json.loads(
+                        (self.cache_root / 'tree.json').read_text(
+                            encoding='utf-8')
+                    )
+                    self._index_tree(cached)
+                    self._tree = cached
+                    return self._tree
+                except (OSError, ValueError):
+                    pass  # Sidecar body missing — refetch unconditionally
+                r = self._http_get(url)
+            r.raise_for_status()
+            payload = r.json()
+            self._tree_etag = r.headers.get('ETag')
+            self._record_etag('@tree', self._tree_etag)
+            tree = payload.get('tree', [])
+            if payload.get('truncated'):
+                subtree = self._get_subtree(self.reports_path)
+                seen = {e.get('path') for e in tree}
+                tree = tree + [e for e in subtree if e['path'] not in seen]
+            self._index_tree(tree)
+            body = json.dumps(tree)
+            for target in filter(None, (cache_dir, self.cache_root)):
+                try:
+                    target.mkdir(parents=True, exist_ok=True)
+                    (target / 'tree.json').write_text(body, encoding='utf-8')
+                except OSError:
+                    pass  # Cache write failure is non-fatal
+            self._tree = tree
+            self._save_etags()
+        except (*_FETCH_ERRORS, ValueError):
+            self._tree = []
+        return self._tree
+
+    def _get_subtree(self, root_path: str) -> List[Dict]:
+        """
+        Enumerate blobs under root_path via per-directory tree fetches.
+
+        Lists root_path with the contents API (which exposes each child
+        directory's tree SHA), then issues one recursive Trees call per
+        child directory — each far below the truncation limit.
+        """
+        url = (f"{GITHUB_API}/repos/{self.repo}/contents/{quote(root_path)}"
+               f"?ref={self.branch}")
+        try:
+            r = self._http_get(url)
+            r.raise_for_status()
+            listing = r.json()
+        except (*_FETCH_ERRORS, ValueError):
+            return []
+        if isinstance(listing, dict):
+            listing = [listing]
+
+        entries = []
+        for item in listing:
+            path = item.get('path', '')
+            if item.get('type') == 'file':
+                entries.append(
+                    {'path': path, 'type': 'blob', 'sha': item.get('sha')}
+                )
+            elif item.get('type') == 'dir' and item.get('sha'):
+                tree_url = (f"{GITHUB_API}/repos/{self.repo}/git/trees/"
+                            f"{item['sha']}?recursive=1")
+                try:
+                    tr = self._http_get(tree_url)
+                    tr.raise_for_status()
+                    children = tr.json().get('tree', [])
+                except (*_FETCH_ERRORS, ValueError):
+                    continue
+                for e in children:
+                    if e.get('type') == 'blob':
+                        entries.append({
+                            'path': f"{path}/{e['path']}",
+                            'type': 'blob',
+                            'sha': e.get('sha'),
+                        })
+        return entries
+
+    def _cache_paths(self, path: str) -> List[Path]:
+        """Cache file candidates for a repo path (commit-scoped, then blob)."""
+        candidates = []
+        cache_dir = self._get_cache_dir()
+        if cache_dir:
+            key = hashlib.sha1(path.encode()).hexdigest()
+            candidates.append(cache_dir / f'{key}.txt')
+        # Blob-SHA key survives branch-tip advances for unchanged files
+        blob_sha = self._blob_shas.get(path)
+        if blob_sha:
+            candidates.append(self.cache_root / 'blobs' / f'{blob_sha}.txt')
+        return candidates
+
+    def _fetch_bytes(self, path: str) -> Optional[bytes]:
+        """
+        Fetch a file's raw bytes, preferring the on-disk cache.
+
+        Returning bytes defers UTF-8 decoding to the caller, which decodes
+        once — r.text would decode here and the matcher would lowercase
+        again, doubling the memory traffic over large files.
+        """
+        candidates = self._cache_paths(path)
+        for cached in candidates:
+            try:
+                return cached.read_bytes()
+            except OSError:
+                pass
+
+        # SHA-keyed caches missed (new commit, or the tree fetch failed).
+        # Revalidate against the last-known ETag: a 304 skips the body
+        # bytes and we serve the path-keyed copy from the previous run.
+        key = hashlib.sha1(path.encode()).hexdigest()
+        body_path = self.cache_root / 'bodies' / f'{key}.txt'
+        etag = self._load_etags().get(path)
+        headers = {'If-None-Match': etag} if etag else None
+
+        url = f"{RAW_BASE}/{self.repo}/{self.branch}/{quote(path)}"
+        try:
+            r = self._http_get(url, headers=headers)
+            if r.status_code == 304:
+                try:
+                    return body_path.read_bytes()
+                except OSError:
+                    r = self._http_get(url)
+            r.raise_for_status()
+            data = r.content
+        except _FETCH_ERRORS:
+            return None
+
+        self._record_etag(path, r.headers.get('ETag'))
+        for cached in (*candidates, body_path):
+            try:
+                cached.parent.mkdir(parents=True, exist_ok=True)
+                cached.write_bytes(data)
+            except OSError:
+                pass  # Cache write failure is non-fatal
+        return data
+
+    def find_related_trrs(
+        self, technique_id: str, technique_name: str = ""
+    ) -> List[Dict]:
+        """
+        Find published TRRs related to the technique.
+
+        Returns a list of match dicts (see _match_trr_content) with an
+        added 'file_path' key, sorted by path.
+        """
+        parent_id = technique_id.split('.')[0] if '.' in technique_id else ''
+        matcher = _compile_matcher(technique_id, parent_id, technique_name)
+        self._get_tree()
+        readme_paths = self._readmes
+
+        related = []
+        # Fetches are network-latency-bound — overlap them in a thread pool
+        # (requests sessions are thread-safe for GET).
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = {ex.submit(self._fetch_bytes, p): p for p in readme_paths}
+            for fut in as_completed(futures):
+                data = fut.result()
+                if not data:
+                    continue
+                content = data.decode('utf-8', 'replace')
+                match = _match_with_matcher(content, matcher, content.lower())
+                if match:
+                    match['file_path'] = futures[fut]
+                    related.append(match)
+
+        self._save_etags()
+        related.sort(key=lambda m: m['file_path'])
+        return related
+
+    def scan_corpus_technique_ids(self, known_ids) -> Dict[str, set]:
+        """
+        Map every report README to the known ATT&CK IDs it mentions.
+
+        One fetch and one scan per file regardless of how many technique
+        IDs are in play — useful for warming per-technique lookups across
+        a whole session instead of re-reading the corpus per technique.
+        """
+        scan = make_technique_id_scanner(known_ids)
+        self._get_tree()
+        corpus: Dict[str, set] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = {ex.submit(self._fetch_bytes, p): p
+                       for p in self._readmes}
+            for fut in as_completed(futures):
+                data = fut.result()
+                if data:
+                    corpus[futures[fut]] = scan(
+                        data.decode('utf-8', 'replace')
+                    )
+        self._save_etags()
+        return corpus
+
+    def find_ddm_files(self, technique_id: str) -> List[Dict]:
+        """
+        Find DDM JSON files referencing the technique.
+
+        Matches on filename (technique ID with '.' replaced by '_') or on
+        the technique ID appearing in the DDM's JSON content.
+        """
+        self._get_tree()
+        ddm_paths = self._ddms
+
+        fname_key = technique_id.replace('.', '_')
+        id_bytes = technique_id.encode('utf-8')
+        found = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as ex:
+            futures = {ex.submit(self._fetch_bytes, p): p for p in ddm_paths}
+            for fut in as_completed(futures):
+                path = futures[fut]
+                if fname_key in path.rsplit('/', 1)[-1]:
+                    found.append({'file_path': path})
+                    continue
+                data = fut.result()
+                # JSON is ASCII-safe for the ID — search bytes, skip decoding
+                if data and id_bytes in data:
+                    found.append({'file_path': path})
+
+        self._save_etags()
+        found.sort(key=lambda d: d['file_path'])
+        return found
+
+
+class ExistingTRRScanner:
+    """
+    Scans the local working tree for existing TRRs and DDM files.
+
+    Walks 'Completed TRR Reports' and 'WIP TRRs' under the repository root
+    (no network access required).
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = root or Path(__file__).resolve().parents[3]
+        self.report_dirs = [
+            self.root / 'Completed TRR Reports',
+            self.root / 'WIP TRRs',
+        ]
+
+    def find_related_trrs(
+        self, technique_id: str, technique_name: str = ""
+    ) -> List[Dict]:
+        """Find local TRR READMEs related to the technique."""
+        parent_id = technique_id.split('.')[0] if '.' in technique_id else ''
+        # The matcher is a pure function of the technique query — compile
+        # it once here, not per README.
+        matcher = _compile_matcher(technique_id, parent_id, technique_name)
+        related = []
+        for base in self.report_dirs:
+            if not base.is_dir():
+                continue
+            for trr_file in sorted(base.rglob('README.md')):
+                # mmap + bytes prefilter: the kernel pages the file in
+                # lazily and non-matching files are rejected without ever
+                # allocating/decoding a Python string.
+                try:
+                    with trr_file.open('rb') as fh, \
+                            mmap.mmap(fh.fileno(), 0,
+                                      access=mmap.ACCESS_READ) as mm:
+                        if not matcher.prefilter_bytes_re.search(mm):
+                            continue
+                        data = bytes(mm)
+                except (OSError, ValueError):
+                    continue
+                content = data.decode('utf-8', 'replace')
+                match = _match_with_matcher(content, matcher)
+                if match:
+                    match['file_path'] = trr_file.relative_to(self.root).as_posix()
+                    related.append(match)
+        return related
+
+    def find_ddm_files(self, technique_id: str) -> List[Dict]:
+        """Find local DDM JSON files referencing the technique."""
+        fname_key = technique_id.replace('.', '_')
+        id_bytes = technique_id.encode('utf-8')
+        found = []
+        for base in self.report_dirs:
+            if not base.is_dir():
+                continue
+            for ddm_file in sorted(base.rglob('ddms/*.json')):
+                if self._ddm_matches_technique(ddm_file, fname_key, id_bytes):
+                    found.append({
+                        'file_path': ddm_file.relative_to(self.root).as_posix(),
+                    })
+        return found
+
+    def _ddm_matches_technique(
+        self, ddm_file: Path, fname_key: str, id_bytes: bytes
+    ) -> bool:
+        """
+        Check whether a DDM file references the technique.
+
+        Only a substring test is needed, so the raw bytes are searched
+        directly — no json.loads round-trip, and no decode (the ID is
+        ASCII and appears verbatim in the JSON).
+        """
+        if fname_key in ddm_file.name:
+            return True
+        try:
+            return id_bytes in ddm_file.read_bytes()
+        except OSError:
+            return False
+
+
+def scan_for_existing_trrs(
+    technique_id: str,
+    technique_name: str = "",
+    include_github: bool = False,
+    repo: str = "McBeer89/TL-McBeer-Repo",
+    verbose: bool = False,
+) -> Dict:
+    """
+    Scan for existing TRRs and DDMs covering a technique.
+
+    Args:
+        technique_id: MITRE ATT&CK technique ID (e.g. 'T1505.003')
+        technique_name: Technique name for name-based matching
+        include_github: Also scan the published GitHub repo
+        repo: GitHub repo (owner/name) to scan when include_github is set
+        verbose: Print per-match progress
+
+    Returns:
+        Dict with 'technique_id', 'trrs' (match dicts), and 'ddm_files'
+        (each flagged 'covered_by_trr' when it lives under a matched TRR).
+    """
+    scanner = (
+        GitHubTRRScanner(repo=repo) if include_github else ExistingTRRScanner()
+    )
+    trrs = scanner.find_related_trrs(technique_id, technique_name)
+    ddms = scanner.find_ddm_files(technique_id)
+
+    matched_prefixes = {
+        t['file_path'][:-len('/README.md')]
+        if t['file_path'].endswith('/README.md') else t['file_path']
+        for t in trrs
+    }
+    # O(1) set membership per ancestor directory instead of a linear
+    # startswith sweep over every matched prefix — and exact component
+    # boundaries, so 'TRR0011' no longer covers a 'TRR00112' sibling.
+    for ddm in ddms:
+        covered = False
+        prefix = ddm['file_path']
+        while True:
+            if prefix in matched_prefixes:
+                covered = True
+                break
+            head, sep, _ = prefix.rpartition('/')
+            if not sep:
+                break
+            prefix = head
+        ddm['covered_by_trr'] = covered
+
+    if verbose:
+        for t in trrs:
+            print(f"  [scan] {t.get('trr_id') or '?'} ({t['match_type']}): "
+                  f"{t['file_path']}")
+        for d in ddms:
+            print(f"  [scan] DDM: {d['file_path']}")
+
+    return {
+        'technique_id': technique_id,
+        'trrs': trrs,
+        'ddm_files': ddms,
+    }
@@ -4,6 +4,7 @@ Utility modules for the TRR Source Scraper.
 
 from utils.helpers import (
     RateLimiter,
+    AsyncRateLimiter,
     ConfigManager,
     validate_technique_id,
     normalize_technique_id,
@@ -15,7 +16,9 @@ from utils.helpers import (
     extract_meta_description,
     extract_title,
     extract_date,
+    extract_page_metadata,
     create_session,
+    create_http2_client,
     get_category_for_domain,
     format_date,
     deduplicate_results,
@@ -23,10 +26,15 @@ from utils.helpers import (
     is_broad_technique,
 )
 from utils.cache import get_cached, set_cached, get_cache_stats, reset_cache_stats
-from utils.content_analysis import analyze_page_content, analyze_raw_text
+from utils.content_analysis import (
+    analyze_page_content,
+    analyze_pages,
+    analyze_raw_text,
+)
 
 __all__ = [
     'RateLimiter',
+    'AsyncRateLimiter',
     'ConfigManager',
     'validate_technique_id',
     'normalize_technique_id',
@@ -38,7 +46,9 @@ __all__ = [
     'extract_meta_description',
     'extract_title',
     'extract_date',
+    'extract_page_metadata',
     'create_session',
+    'create_http2_client',
     'get_category_for_domain',
     'format_date',
     'deduplicate_results',
@@ -47,6 +57,7 @@ __all__ = [
     'get_cache_stats',
     'reset_cache_stats',
     'analyze_page_content',
+    'analyze_pages',
     'analyze_raw_text',
     'extract_attack_keywords',
     'is_broad_technique',
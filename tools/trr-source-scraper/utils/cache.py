@@ -1,21 +1,62 @@
 """
-Simple file-based JSON cache for scraped data.
-
-Cache files are stored in output/.cache/ and expire after a configurable TTL.
+SQLite-backed cache for scraped data.
+
+All entries live in one WAL-mode database at output/.cache/cache.db and
+expire after a configurable TTL. A single store means one file
+descriptor, a shared page cache, and indexed key lookups instead of a
+file open + parse per key; WAL keeps writes atomic without per-write
+directory churn and tolerates concurrent readers (including other
+processes).
 """
 
 import json
+import sqlite3
+import threading
 import time
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 _CACHE_DIR = Path(__file__).parent.parent / "output" / ".cache"
+_DB_PATH = _CACHE_DIR / "cache.db"
+
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.Lock()
+
+# In-process layer over the SQLite store: repeat lookups for the same
+# key within one run skip the query and the disk read. It holds the
+# serialized blob, not the live object — every hit deserializes a fresh
+# copy, so callers that mutate a returned value (search-result
+# enrichment does) can't alias the cache like a shared reference would.
+# Bounded FIFO — insertion order is good enough for scrape workloads
+# where a key is hot for one technique and then done.
+_MEM_MAX = 4096
+_mem: dict = {}  # key -> (cached_at, blob)
 
 # Module-level cache statistics
 _cache_stats = {'hits': 0, 'misses': 0, 'expired': 0, 'errors': 0}
 
 
+def _dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 bytes, via orjson's C encoder if present."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(blob: bytes) -> Any:
+    """Deserialize cache bytes (orjson and stdlib output are interchangeable)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(blob)
+    return json.loads(blob)
+
+
 def get_cache_stats() -> dict:
     """Return a copy of the current cache hit/miss statistics."""
     return dict(_cache_stats)
@@ -27,10 +68,30 @@ def reset_cache_stats():
         _cache_stats[k] = 0
 
 
-def _cache_path(key: str) -> Path:
-    """Return the file path for a given cache key."""
-    safe_key = key.replace("/", "_").replace(".", "_")
-    return _CACHE_DIR / f"{safe_key}.json"
+def _get_conn() -> sqlite3.Connection:
+    """Return the shared connection, creating the database on first use."""
+    global _conn
+    if _conn is None:
+        # One-shot: the directory is created the first time any entry is
+        # touched, so steady-state reads and writes pay no stat syscalls.
+        try:
+            _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
+        conn = sqlite3.connect(
+            _DB_PATH, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Concurrent writers (parallel enrichment, a second scraper run)
+        # briefly queue on the WAL write lock instead of erroring out.
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, cached_at REAL, data BLOB)"
+        )
+        _conn = conn
+    return _conn
 
 
 def get_cached(key: str, ttl_days: int = 7) -> Optional[Any]:
@@ -44,23 +105,52 @@ def get_cached(key: str, ttl_days: int = 7) -> Optional[Any]:
     Returns:
         Deserialized data, or None if cache miss or expired
     """
-    path = _cache_path(key)
-    if not path.exists():
+    mem_entry = _mem.get(key)
+    if mem_entry is not None:
+        cached_at, blob = mem_entry
+        if time.time() - cached_at <= ttl_days * 86400:
+            try:
+                result = _loads(blob)
+            except Exception:
+                _cache_stats['errors'] += 1
+                return None
+            _cache_stats['hits'] += 1
+            return result
+        _mem.pop(key, None)
+
+    try:
+        with _conn_lock:
+            row = _get_conn().execute(
+                "SELECT cached_at, data FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+    except Exception:
+        _cache_stats['errors'] += 1
+        return None
+
+    if row is None:
         _cache_stats['misses'] += 1
         return None
 
+    cached_at, data = row
+    if time.time() - cached_at > ttl_days * 86400:
+        _cache_stats['expired'] += 1
+        return None
+
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            entry = json.load(f)
-        stored_at = entry.get("_cached_at", 0)
-        if time.time() - stored_at > ttl_days * 86400:
-            _cache_stats['expired'] += 1
-            return None
-        _cache_stats['hits'] += 1
-        return entry.get("data")
+        result = _loads(data)
     except Exception:
         _cache_stats['errors'] += 1
         return None
+    _remember(key, cached_at, data)
+    _cache_stats['hits'] += 1
+    return result
+
+
+def _remember(key: str, cached_at: float, blob: bytes) -> None:
+    """Insert a serialized blob, evicting oldest-first at the cap."""
+    while len(_mem) >= _MEM_MAX:
+        _mem.pop(next(iter(_mem)), None)
+    _mem[key] = (cached_at, blob)
 
 
 def set_cached(key: str, data: Any) -> None:
@@ -71,11 +161,15 @@ def set_cached(key: str, data: Any) -> None:
         key: Cache key
         data: JSON-serialisable data to store
     """
-    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-    path = _cache_path(key)
-    entry = {"_cached_at": time.time(), "data": data}
+    now = time.time()
     try:
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(entry, f, indent=2)
+        blob = _dumps(data)
+        _remember(key, now, blob)
+        with _conn_lock:
+            _get_conn().execute(
+                "INSERT OR REPLACE INTO cache (key, cached_at, data) "
+                "VALUES (?, ?, ?)",
+                (key, now, blob),
+            )
     except Exception:
         pass  # Cache write failure is non-fatal
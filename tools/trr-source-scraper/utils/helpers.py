@@ -2,30 +2,100 @@
 Utility helper functions for the TRR Source Scraper.
 """
 
+import asyncio
+import threading
 import time
 import re
 import json
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse, unquote
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
 
 
 class RateLimiter:
-    """Simple rate limiter to control request frequency."""
-    
+    """
+    Rate limiter with one clock per domain.
+
+    Politeness is a per-host concern: requests to different domains have
+    no shared quota, so each domain gets its own clock and only requests
+    to the same domain serialize on the delay. Calling wait() without a
+    domain uses a single shared clock (single-host scrapers). Thread-safe
+    for the domain-bucketed fetch pools.
+    """
+
     def __init__(self, delay: float = 2.0):
         self.delay = delay
-        self.last_request_time = 0
-    
-    def wait(self):
-        """Wait for the required delay since last request."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.delay:
-            time.sleep(self.delay - elapsed)
-        self.last_request_time = time.time()
+        self._next_ok: Dict[Optional[str], float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, domain: Optional[str] = None):
+        """Wait until this domain's clock allows the next request."""
+        while True:
+            with self._lock:
+                now = time.time()
+                next_ok = self._next_ok.get(domain, 0)
+                if now >= next_ok:
+                    self._next_ok[domain] = now + self.delay
+                    return
+                remaining = next_ok - now
+            # Sleep outside the lock so other domains aren't held up
+            time.sleep(remaining)
+
+
+class AsyncRateLimiter:
+    """
+    Per-domain politeness for the event-loop fetch paths.
+
+    Same per-domain clock semantics as RateLimiter, but waits with
+    asyncio.sleep so blocked coroutines yield the loop. Servers that
+    push back are honored via backoff(): a Retry-After or exhausted
+    X-RateLimit-Remaining pushes that domain's clock forward.
+    """
+
+    def __init__(self, delay: float = 2.0):
+        self.delay = delay
+        self._next_ok: Dict[str, float] = {}
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def wait(self, domain: str):
+        """Wait until this domain's clock allows the next request."""
+        async with self._locks[domain]:
+            now = time.time()
+            next_ok = self._next_ok.get(domain, 0)
+            if now < next_ok:
+                await asyncio.sleep(next_ok - now)
+            self._next_ok[domain] = max(now, next_ok) + self.delay
+
+    def backoff(self, domain: str, headers) -> None:
+        """Push a domain's clock forward based on rate-limit headers."""
+        hold = 0.0
+        retry_after = headers.get('Retry-After', '')
+        if retry_after:
+            try:
+                hold = float(retry_after)
+            except ValueError:
+                pass  # HTTP-date form — fall through to the default hold
+        if not hold and headers.get('X-RateLimit-Remaining') == '0':
+            hold = self.delay * 4
+        if hold:
+            self._next_ok[domain] = max(
+                self._next_ok.get(domain, 0), time.time() + hold
+            )
 
 
 class ConfigManager:
@@ -410,6 +480,10 @@ def compute_relevance_score(
     return max(min(score, 1.0), 0.0)
 
 
+# Both URL predicates are pure and hit repeatedly for the same URL
+# (fetch, enrichment heuristics, rate limiting), so memoizing turns the
+# repeat urlparse calls into dict hits.
+@lru_cache(maxsize=8192)
 def extract_domain(url: str) -> str:
     """Extract the domain from a URL."""
     try:
@@ -419,6 +493,7 @@ def extract_domain(url: str) -> str:
         return ""
 
 
+@lru_cache(maxsize=8192)
 def is_valid_url(url: str) -> bool:
     """Check if a URL is valid."""
     try:
@@ -520,19 +595,141 @@ def extract_date(soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
+# Compiled XPath expressions for metadata extraction — etree.XPath parses
+# the expression once at import instead of on every call. Preference
+# order mirrors the soup-based extractors above, so these stay separate
+# rather than one union (XPath unions return document order).
+_XP_OG_TITLE = etree.XPath('string((//meta[@property="og:title"]/@content)[1])')
+_XP_TITLE = etree.XPath('string((//title)[1])')
+_XP_H1 = etree.XPath('string((//h1)[1])')
+_XP_DESCRIPTIONS = (
+    etree.XPath('string((//meta[@name="description"]/@content)[1])'),
+    etree.XPath('string((//meta[@property="og:description"]/@content)[1])'),
+    etree.XPath('string((//meta[@name="twitter:description"]/@content)[1])'),
+    etree.XPath('string((//p)[1])'),
+)
+_XP_DATES = (
+    etree.XPath('string((//meta[@property="article:published_time"]/@content)[1])'),
+    etree.XPath('string((//meta[@name="date"]/@content)[1])'),
+    etree.XPath('string((//time/@datetime)[1])'),
+)
+
+_DATE_TEXT_PATTERNS = [
+    re.compile(r'(\d{4}-\d{2}-\d{2})'),
+    re.compile(r'(\d{2}/\d{2}/\d{4})'),
+    re.compile(r'((?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{1,2},?\s+\d{4})'),
+]
+
+
+def extract_page_metadata(content) -> Dict[str, Any]:
+    """
+    Extract title, description, and date from raw HTML in one lxml parse.
+
+    lxml parses in C and the compiled XPaths touch only the nodes they
+    name, skipping the BeautifulSoup object tree entirely — use this when
+    only the metadata fields are needed. Accepts bytes (response.content)
+    or str (rendered HTML). Returns the same field semantics as
+    extract_title/extract_meta_description/extract_date.
+    """
+    try:
+        tree = lxml_html.fromstring(content)
+    except (etree.ParserError, ValueError):
+        return {'title': 'Untitled', 'description': '', 'date': None}
+
+    title = (_XP_OG_TITLE(tree) or _XP_TITLE(tree) or _XP_H1(tree)).strip()
+
+    description = ''
+    for xp in _XP_DESCRIPTIONS:
+        description = xp(tree).strip()
+        if description:
+            break
+
+    date = None
+    for xp in _XP_DATES:
+        value = xp(tree).strip()
+        if value:
+            date = value[:10]
+            break
+    if date is None:
+        # Fall back to date-looking text in common container elements
+        for tag in ('span', 'div', 'p'):
+            seen = 0
+            for elem in tree.iter(tag):
+                text = elem.text_content()
+                for pattern in _DATE_TEXT_PATTERNS:
+                    match = pattern.search(text)
+                    if match:
+                        date = match.group(1)
+                        break
+                seen += 1
+                if date or seen >= 20:
+                    break
+            if date:
+                break
+
+    return {'title': title or 'Untitled', 'description': description,
+            'date': date}
+
+
 def create_session(user_agent: str) -> requests.Session:
-    """Create a requests session with proper headers."""
+    """
+    Create a requests session with proper headers and sized pools.
+
+    The default adapter keeps only 10 pooled connections, which evicts
+    keep-alive state as soon as a burst touches more hosts than that —
+    every later request then pays a fresh TCP + TLS handshake. The
+    larger pools preserve connection reuse across fetch batches, and
+    transient failures (429s, 5xxs) retry with backoff.
+    """
     session = requests.Session()
     session.headers.update({
         'User-Agent': user_agent,
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
         'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
+        # Accept-Encoding is left to requests' default: it advertises br
+        # only when a brotli decoder is installed. Hardcoding 'br' made
+        # servers send compressed bytes nothing here could decode.
         'Connection': 'keep-alive',
     })
+    adapter = HTTPAdapter(
+        pool_connections=64,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     return session
 
 
+def create_http2_client(user_agent: str):
+    """
+    Create an httpx client with HTTP/2 enabled, or None if httpx is missing.
+
+    HTTP/2 multiplexes concurrent GETs against the same host over one
+    TCP/TLS connection, so hammering raw.githubusercontent.com from a
+    thread pool costs one handshake instead of one per worker. Callers
+    must handle the None fallback and use a requests session instead.
+    """
+    if not HTTPX_AVAILABLE:
+        return None
+    try:
+        return httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=32,
+                                max_keepalive_connections=32),
+            timeout=15.0,
+            follow_redirects=True,
+            headers={'User-Agent': user_agent},
+        )
+    except ImportError:
+        # httpx raises ImportError for http2=True without the h2 extra
+        return None
+
+
 def get_category_for_domain(domain: str, trusted_sources: Dict) -> tuple:
     """
     Determine the category and priority for a given domain.